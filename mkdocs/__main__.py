@@ -2,17 +2,21 @@
 
 from __future__ import annotations
 
+import importlib
 import logging
+import logging.handlers
 import os
+import queue
 import shutil
 import sys
 import textwrap
 import traceback
 import warnings
+from typing import Dict, Optional, Tuple
 
 import click
 
-from mkdocs import __version__, config, utils
+from mkdocs import __version__
 
 if sys.platform.startswith("win"):
     try:
@@ -70,11 +74,23 @@ class ColorFormatter(logging.Formatter):
             prefix = click.style(prefix, fg=self.colors[record.levelname])
         if self.text_wrapper.width:
             # Only wrap text if a terminal width was detected
-            msg = '\n'.join(self.text_wrapper.fill(line) for line in message.splitlines())
+            msg = '\n'.join(self._wrap_line(line) for line in message.splitlines())
             # Prepend prefix after wrapping so that color codes don't affect length
             return prefix + msg[12:]
         return prefix + message
 
+    def _wrap_line(self, line: str) -> str:
+        # A line which already fits, and has no tabs to expand or trailing whitespace to drop,
+        # would come out of `text_wrapper.fill` just indented, so skip the wrapper for it.
+        wrapper = self.text_wrapper
+        if (
+            len(line) + len(wrapper.initial_indent) <= wrapper.width
+            and '\t' not in line
+            and not line[-1:].isspace()
+        ):
+            return wrapper.initial_indent + line if line else ''
+        return wrapper.fill(line)
+
 
 class State:
     """Maintain logging level."""
@@ -89,50 +105,28 @@ class State:
         self.stream.setFormatter(ColorFormatter())
         self.stream.setLevel(level)
         self.stream.name = 'MkDocsStreamHandler'
-        self.logger.addHandler(self.stream)
 
-    def __del__(self):
-        self.logger.removeHandler(self.stream)
+        # The stream handler formats and writes records in a background thread, so that logging
+        # doesn't hold up the build. Records below its level aren't even queued.
+        stream = self.stream
+        self.queue_handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+        self.queue_handler.addFilter(lambda record: record.levelno >= stream.level)
+        self.listener = logging.handlers.QueueListener(
+            self.queue_handler.queue, self.stream, respect_handler_level=True
+        )
+        self.listener.start()
+        self.logger.addHandler(self.queue_handler)
+
+    def close(self):
+        """Write out any queued log records, then log to the stream directly."""
+        if self.queue_handler in self.logger.handlers:
+            self.logger.removeHandler(self.queue_handler)
+            self.listener.stop()
+            self.logger.addHandler(self.stream)
 
 
 pass_state = click.make_pass_decorator(State, ensure=True)
 
-clean_help = "Remove old files from the site_dir before building (the default)."
-config_help = "Provide a specific MkDocs config"
-dev_addr_help = "IP address and port to serve documentation locally (default: localhost:8000)"
-strict_help = "Enable strict mode. This will cause MkDocs to abort the build on any warnings."
-theme_help = "The theme to use when building your documentation."
-theme_choices = utils.get_theme_names()
-site_dir_help = "The directory to output the result of the documentation build."
-use_directory_urls_help = "Use directory URLs when building pages (the default)."
-reload_help = "Enable the live reloading in the development server (this is the default)"
-no_reload_help = "Disable the live reloading in the development server."
-dirty_reload_help = (
-    "Enable the live reloading in the development server, but only re-build files that have changed"
-)
-commit_message_help = (
-    "A commit message to use when committing to the "
-    "GitHub Pages remote branch. Commit {sha} and MkDocs {version} are available as expansions"
-)
-remote_branch_help = (
-    "The remote branch to commit to for GitHub Pages. This "
-    "overrides the value specified in config"
-)
-remote_name_help = (
-    "The remote name to commit to for GitHub Pages. This overrides the value specified in config"
-)
-force_help = "Force the push to the repository."
-no_history_help = "Replace the whole Git history with one new commit."
-ignore_version_help = (
-    "Ignore check that build is not being deployed with an older version of MkDocs."
-)
-watch_theme_help = (
-    "Include the theme in list of files to watch for live reloading. "
-    "Ignored when live reload is not used."
-)
-shell_help = "Use the shell when invoking Git."
-watch_help = "A directory or file to watch for live reloading. Can be supplied multiple times."
-
 
 def add_options(*opts):
     def inner(f):
@@ -176,28 +170,43 @@ def quiet_option(f):
 
 
 common_options = add_options(quiet_option, verbose_option)
-common_config_options = add_options(
-    click.option('-f', '--config-file', type=click.File('rb'), help=config_help),
-    # Don't override config value if user did not specify --strict flag
-    # Conveniently, load_config drops None values
-    click.option('-s', '--strict', is_flag=True, default=None, help=strict_help),
-    click.option('-t', '--theme', type=click.Choice(theme_choices), help=theme_help),
-    # As with --strict, set the default to None so that this doesn't incorrectly
-    # override the config file
-    click.option(
-        '--use-directory-urls/--no-directory-urls',
-        is_flag=True,
-        default=None,
-        help=use_directory_urls_help,
-    ),
-)
-
 PYTHON_VERSION = f"{sys.version_info.major}.{sys.version_info.minor}"
 
 PKG_DIR = os.path.dirname(os.path.abspath(__file__))
 
 
-@click.group(context_settings={'help_option_names': ['-h', '--help']})
+class LazyGroup(click.Group):
+    """A `click.Group` which only imports the module of a subcommand when that subcommand is needed.
+
+    `lazy_subcommands` maps command names to `(module_path, attr_name)` tuples.
+    """
+
+    def __init__(
+        self, *args, lazy_subcommands: Optional[Dict[str, Tuple[str, str]]] = None, **kwargs
+    ):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            module_path, attr_name = self.lazy_subcommands[cmd_name]
+            return getattr(importlib.import_module(module_path), attr_name)
+        return super().get_command(ctx, cmd_name)
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        'serve': ('mkdocs._cli_commands', 'serve_command'),
+        'build': ('mkdocs._cli_commands', 'build_command'),
+        'gh-deploy': ('mkdocs._cli_commands', 'gh_deploy_command'),
+        'new': ('mkdocs._cli_commands', 'new_command'),
+    },
+    context_settings={'help_option_names': ['-h', '--help']},
+)
 @click.version_option(
     __version__,
     '-V',
@@ -205,84 +214,18 @@ PKG_DIR = os.path.dirname(os.path.abspath(__file__))
     message=f'%(prog)s, version %(version)s from { PKG_DIR } (Python { PYTHON_VERSION })',
 )
 @common_options
-def cli():
+@click.pass_context
+def cli(ctx):
     """
     MkDocs - Project documentation with Markdown.
     """
-
-
-@cli.command(name="serve")
-@click.option('-a', '--dev-addr', help=dev_addr_help, metavar='<IP:PORT>')
-@click.option('--livereload', 'livereload', flag_value='livereload', help=reload_help, default=True)
-@click.option('--no-livereload', 'livereload', flag_value='no-livereload', help=no_reload_help)
-@click.option('--dirtyreload', 'livereload', flag_value='dirty', help=dirty_reload_help)
-@click.option('--watch-theme', help=watch_theme_help, is_flag=True)
-@click.option(
-    '-w', '--watch', help=watch_help, type=click.Path(exists=True), multiple=True, default=[]
-)
-@common_config_options
-@common_options
-def serve_command(dev_addr, livereload, watch, **kwargs):
-    """Run the builtin development server"""
-    from mkdocs.commands import serve
-
-    _enable_warnings()
-    serve.serve(dev_addr=dev_addr, livereload=livereload, watch=watch, **kwargs)
-
-
-@cli.command(name="build")
-@click.option('-c', '--clean/--dirty', is_flag=True, default=True, help=clean_help)
-@common_config_options
-@click.option('-d', '--site-dir', type=click.Path(), help=site_dir_help)
-@common_options
-def build_command(clean, **kwargs):
-    """Build the MkDocs documentation"""
-    from mkdocs.commands import build
-
-    _enable_warnings()
-    build.build(config.load_config(**kwargs), dirty=not clean)
-
-
-@cli.command(name="gh-deploy")
-@click.option('-c', '--clean/--dirty', is_flag=True, default=True, help=clean_help)
-@click.option('-m', '--message', help=commit_message_help)
-@click.option('-b', '--remote-branch', help=remote_branch_help)
-@click.option('-r', '--remote-name', help=remote_name_help)
-@click.option('--force', is_flag=True, help=force_help)
-@click.option('--no-history', is_flag=True, help=no_history_help)
-@click.option('--ignore-version', is_flag=True, help=ignore_version_help)
-@click.option('--shell', is_flag=True, help=shell_help)
-@common_config_options
-@click.option('-d', '--site-dir', type=click.Path(), help=site_dir_help)
-@common_options
-def gh_deploy_command(
-    clean, message, remote_branch, remote_name, force, no_history, ignore_version, shell, **kwargs
-):
-    """Deploy your documentation to GitHub Pages"""
-    from mkdocs.commands import build, gh_deploy
-
-    _enable_warnings()
-    cfg = config.load_config(remote_branch=remote_branch, remote_name=remote_name, **kwargs)
-    build.build(cfg, dirty=not clean)
-    gh_deploy.gh_deploy(
-        cfg,
-        message=message,
-        force=force,
-        no_history=no_history,
-        ignore_version=ignore_version,
-        shell=shell,
-    )
-
-
-@cli.command(name="new")
-@click.argument("project_directory")
-@common_options
-def new_command(project_directory):
-    """Create a new MkDocs project"""
-    from mkdocs.commands import new
-
-    new.new(project_directory)
+    # Tear down logging (making sure all log messages are out) before Click reports the result.
+    ctx.call_on_close(ctx.ensure_object(State).close)
 
 
 if __name__ == '__main__':  # pragma: no cover
-    cli()
+    # Run the `cli` of the importable module (rather than this `__main__` copy of it), so that
+    # the lazily loaded subcommands share the same `State` class as the group.
+    from mkdocs.__main__ import cli as _cli
+
+    _cli()
@@ -0,0 +1,157 @@
+"""
+The MkDocs subcommands.
+
+These are imported lazily by the `cli` group in `mkdocs.__main__`, so that only
+the subcommand which is actually invoked pays for its imports.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Optional, Sequence, Tuple
+
+import click
+
+from mkdocs import utils
+from mkdocs.__main__ import _enable_warnings, add_options, common_options
+
+clean_help = "Remove old files from the site_dir before building (the default)."
+config_help = "Provide a specific MkDocs config"
+dev_addr_help = "IP address and port to serve documentation locally (default: localhost:8000)"
+strict_help = "Enable strict mode. This will cause MkDocs to abort the build on any warnings."
+theme_help = "The theme to use when building your documentation."
+site_dir_help = "The directory to output the result of the documentation build."
+use_directory_urls_help = "Use directory URLs when building pages (the default)."
+reload_help = "Enable the live reloading in the development server (this is the default)"
+no_reload_help = "Disable the live reloading in the development server."
+dirty_reload_help = (
+    "Enable the live reloading in the development server, but only re-build files that have changed"
+)
+commit_message_help = (
+    "A commit message to use when committing to the "
+    "GitHub Pages remote branch. Commit {sha} and MkDocs {version} are available as expansions"
+)
+remote_branch_help = (
+    "The remote branch to commit to for GitHub Pages. This "
+    "overrides the value specified in config"
+)
+remote_name_help = (
+    "The remote name to commit to for GitHub Pages. This overrides the value specified in config"
+)
+force_help = "Force the push to the repository."
+no_history_help = "Replace the whole Git history with one new commit."
+ignore_version_help = (
+    "Ignore check that build is not being deployed with an older version of MkDocs."
+)
+watch_theme_help = (
+    "Include the theme in list of files to watch for live reloading. "
+    "Ignored when live reload is not used."
+)
+shell_help = "Use the shell when invoking Git."
+watch_help = "A directory or file to watch for live reloading. Can be supplied multiple times."
+
+
+class LazyChoice(click.Choice):
+    """A `click.Choice` whose choices are only computed (once) when they are first needed."""
+
+    def __init__(self, get_choices: Callable[[], Sequence[str]], case_sensitive: bool = True):
+        self._get_choices = get_choices
+        self._choices: Optional[Tuple[str, ...]] = None
+        self.case_sensitive = case_sensitive
+
+    @property
+    def choices(self) -> Tuple[str, ...]:
+        if self._choices is None:
+            self._choices = tuple(self._get_choices())
+        return self._choices
+
+
+common_config_options = add_options(
+    click.option('-f', '--config-file', type=click.File('rb'), help=config_help),
+    # Don't override config value if user did not specify --strict flag
+    # Conveniently, load_config drops None values
+    click.option('-s', '--strict', is_flag=True, default=None, help=strict_help),
+    click.option('-t', '--theme', type=LazyChoice(utils.get_theme_names), help=theme_help),
+    # As with --strict, set the default to None so that this doesn't incorrectly
+    # override the config file
+    click.option(
+        '--use-directory-urls/--no-directory-urls',
+        is_flag=True,
+        default=None,
+        help=use_directory_urls_help,
+    ),
+)
+
+
+@click.command(name="serve")
+@click.option('-a', '--dev-addr', help=dev_addr_help, metavar='<IP:PORT>')
+@click.option('--livereload', 'livereload', flag_value='livereload', help=reload_help, default=True)
+@click.option('--no-livereload', 'livereload', flag_value='no-livereload', help=no_reload_help)
+@click.option('--dirtyreload', 'livereload', flag_value='dirty', help=dirty_reload_help)
+@click.option('--watch-theme', help=watch_theme_help, is_flag=True)
+@click.option(
+    '-w', '--watch', help=watch_help, type=click.Path(exists=True), multiple=True, default=[]
+)
+@common_config_options
+@common_options
+def serve_command(dev_addr, livereload, watch, **kwargs):
+    """Run the builtin development server"""
+    from mkdocs.commands import serve
+
+    _enable_warnings()
+    serve.serve(dev_addr=dev_addr, livereload=livereload, watch=watch, **kwargs)
+
+
+@click.command(name="build")
+@click.option('-c', '--clean/--dirty', is_flag=True, default=True, help=clean_help)
+@common_config_options
+@click.option('-d', '--site-dir', type=click.Path(), help=site_dir_help)
+@common_options
+def build_command(clean, **kwargs):
+    """Build the MkDocs documentation"""
+    from mkdocs import config
+    from mkdocs.commands import build
+
+    _enable_warnings()
+    build.build(config.load_config(**kwargs), dirty=not clean)
+
+
+@click.command(name="gh-deploy")
+@click.option('-c', '--clean/--dirty', is_flag=True, default=True, help=clean_help)
+@click.option('-m', '--message', help=commit_message_help)
+@click.option('-b', '--remote-branch', help=remote_branch_help)
+@click.option('-r', '--remote-name', help=remote_name_help)
+@click.option('--force', is_flag=True, help=force_help)
+@click.option('--no-history', is_flag=True, help=no_history_help)
+@click.option('--ignore-version', is_flag=True, help=ignore_version_help)
+@click.option('--shell', is_flag=True, help=shell_help)
+@common_config_options
+@click.option('-d', '--site-dir', type=click.Path(), help=site_dir_help)
+@common_options
+def gh_deploy_command(
+    clean, message, remote_branch, remote_name, force, no_history, ignore_version, shell, **kwargs
+):
+    """Deploy your documentation to GitHub Pages"""
+    from mkdocs import config
+    from mkdocs.commands import build, gh_deploy
+
+    _enable_warnings()
+    cfg = config.load_config(remote_branch=remote_branch, remote_name=remote_name, **kwargs)
+    build.build(cfg, dirty=not clean)
+    gh_deploy.gh_deploy(
+        cfg,
+        message=message,
+        force=force,
+        no_history=no_history,
+        ignore_version=ignore_version,
+        shell=shell,
+    )
+
+
+@click.command(name="new")
+@click.argument("project_directory")
+@common_options
+def new_command(project_directory):
+    """Create a new MkDocs project"""
+    from mkdocs.commands import new
+
+    new.new(project_directory)
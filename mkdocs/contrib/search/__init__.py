@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import functools
 import logging
 import os
-from typing import Any, Dict
+from typing import Any, Dict, FrozenSet
 
 from mkdocs import utils
 from mkdocs.config import base, config_options
@@ -14,13 +15,24 @@ log = logging.getLogger(__name__)
 base_path = os.path.dirname(os.path.abspath(__file__))
 
 
+@functools.lru_cache(maxsize=None)
+def _get_lunr_langs() -> FrozenSet[str]:
+    """Return the languages which have a `lunr.{lang}.js` file in `lunr-language`."""
+    return frozenset(
+        filename[len('lunr.') : -len('.js')]
+        for filename in os.listdir(os.path.join(base_path, 'lunr-language'))
+        if filename.startswith('lunr.') and filename.endswith('.js')
+    )
+
+
 class LangOption(config_options.OptionallyRequired):
     """Validate Language(s) provided in config are known languages."""
 
     def get_lunr_supported_lang(self, lang):
+        lunr_langs = _get_lunr_langs()
         for lang_part in lang.split("_"):
             lang_part = lang_part.lower()
-            if os.path.isfile(os.path.join(base_path, 'lunr-language', f'lunr.{lang_part}.js')):
+            if lang_part in lunr_langs:
                 return lang_part
 
     def run_validation(self, value):
@@ -28,19 +40,25 @@ class LangOption(config_options.OptionallyRequired):
             value = [value]
         elif not isinstance(value, (list, tuple)):
             raise config_options.ValidationError('Expected a list of language codes.')
-        for lang in list(value):
-            if lang != 'en':
-                lang_detected = self.get_lunr_supported_lang(lang)
-                if not lang_detected:
-                    log.info(f"Option search.lang '{lang}' is not supported, falling back to 'en'")
-                    value.remove(lang)
-                    if 'en' not in value:
-                        value.append('en')
-                elif lang_detected != lang:
-                    value.remove(lang)
-                    value.append(lang_detected)
-                    log.info(f"Option search.lang '{lang}' switched to '{lang_detected}'")
-        return value
+        # Supported languages keep their place; replacements for the others go at the end.
+        supported, replacements = [], []
+        has_en = 'en' in value
+        for lang in value:
+            if lang == 'en':
+                supported.append(lang)
+                continue
+            lang_detected = self.get_lunr_supported_lang(lang)
+            if not lang_detected:
+                log.info(f"Option search.lang '{lang}' is not supported, falling back to 'en'")
+                if not has_en:
+                    replacements.append('en')
+                    has_en = True
+            elif lang_detected != lang:
+                replacements.append(lang_detected)
+                log.info(f"Option search.lang '{lang}' switched to '{lang_detected}'")
+            else:
+                supported.append(lang)
+        return supported + replacements
 
 
 class _PluginConfig:
@@ -96,16 +114,16 @@ class SearchPlugin(BasePlugin):
         if not ('search_index_only' in config['theme'] and config['theme']['search_index_only']):
             # Include language support files in output. Copy them directly
             # so that only the needed files are included.
+            langs = self.config['lang']
             files = []
-            if len(self.config['lang']) > 1 or 'en' not in self.config['lang']:
+            if len(langs) > 1 or 'en' not in langs:
                 files.append('lunr.stemmer.support.js')
-            if len(self.config['lang']) > 1:
+            if len(langs) > 1:
                 files.append('lunr.multi.js')
-            if 'ja' in self.config['lang'] or 'jp' in self.config['lang']:
+            if not {'ja', 'jp'}.isdisjoint(langs):
                 files.append('tinyseg.js')
-            for lang in self.config['lang']:
-                if lang != 'en':
-                    files.append(f'lunr.{lang}.js')
+            # Each language file only needs to be copied once.
+            files.extend(f'lunr.{lang}.js' for lang in dict.fromkeys(langs) if lang != 'en')
 
             for filename in files:
                 from_path = os.path.join(base_path, 'lunr-language', filename)
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List
+
+if TYPE_CHECKING:
+    from mkdocs.structure.nav import Section
+
+
+def get_ancestors(item) -> List[Section]:
+    """Return a new list of the parents of a nav item, from the nearest up to the top level."""
+    ancestors = []
+    parent = item.parent
+    while parent is not None:
+        ancestors.append(parent)
+        parent = parent.parent
+    return ancestors
@@ -1,12 +1,28 @@
 from __future__ import annotations
 
+import concurrent.futures
 import fnmatch
+import functools
 import logging
 import os
 import posixpath
+import re
 import shutil
+import weakref
+from collections import defaultdict
 from pathlib import PurePath
-from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Sequence
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Sequence,
+    Set,
+    Tuple,
+)
 from urllib.parse import quote as urlquote
 
 import jinja2.environment
@@ -25,6 +41,8 @@ class Files:
 
     def __init__(self, files: List[File]) -> None:
         self._files = files
+        for file in files:
+            file._add_collection(self)
         self._src_uris: Optional[Dict[str, File]] = None
 
     def __iter__(self) -> Iterator[File]:
@@ -37,7 +55,8 @@ class Files:
 
     def __contains__(self, path: str) -> bool:
         """Whether the file with this `src_uri` is in the collection."""
-        return PurePath(path).as_posix() in self.src_uris
+        src_uris = self.src_uris
+        return path in src_uris or PurePath(path).as_posix() in src_uris
 
     @property
     def src_paths(self) -> Dict[str, File]:
@@ -50,28 +69,74 @@ class Files:
         [`src_uri`][mkdocs.structure.files.File.src_uri]."""
         if self._src_uris is None:
             self._src_uris = {file.src_uri: file for file in self._files}
+            self._has_duplicate_src_uris = len(self._src_uris) < len(self._files)
         return self._src_uris
 
     def get_file_from_path(self, path: str) -> Optional[File]:
         """Return a File instance with File.src_uri equal to path."""
-        return self.src_uris.get(PurePath(path).as_posix())
+        src_uris = self.src_uris
+        file = src_uris.get(path)
+        if file is None:
+            # Only normalize the path (e.g. backslashes on Windows) if it isn't already a `src_uri`.
+            file = src_uris.get(PurePath(path).as_posix())
+        return file
 
     def append(self, file: File) -> None:
         """Append file to Files collection."""
-        self._src_uris = None
         self._files.append(file)
+        file._add_collection(self)
+        if self._src_uris is not None:
+            if file.src_uri in self._src_uris:
+                self._has_duplicate_src_uris = True
+            self._src_uris[file.src_uri] = file
 
     def remove(self, file: File) -> None:
         """Remove file from Files collection."""
-        self._src_uris = None
-        self._files.remove(file)
+        file = self._files.pop(self._files.index(file))
+        file._remove_collection(self)
+        if self._src_uris is not None and self._src_uris.get(file.src_uri) is file:
+            if self._has_duplicate_src_uris:
+                # Another file may have the same `src_uri`, so find it on the next lookup.
+                self._src_uris = None
+            else:
+                del self._src_uris[file.src_uri]
+
+    def _src_uri_changed(self, file: File, old_src_uri: str) -> None:
+        """Follow a change of `file.src_uri` from `old_src_uri`."""
+        if self._src_uris is not None:
+            if (
+                self._has_duplicate_src_uris
+                or self._src_uris.get(old_src_uri) is not file
+                or file.src_uri in self._src_uris
+            ):
+                self._src_uris = None
+            else:
+                del self._src_uris[old_src_uri]
+                self._src_uris[file.src_uri] = file
 
     def copy_static_files(self, dirty: bool = False) -> None:
         """Copy static files from source to destination."""
-        for file in self:
-            if not file.is_documentation_page():
+        static_files = [file for file in self if not file.is_documentation_page()]
+        # Check the files that rely on `File.is_modified` against one listing of each destination
+        # directory. Files which customize the copy check themselves, as before.
+        dest_mtimes = _get_dest_mtimes(filter(_checks_mtimes, static_files)) if dirty else {}
+
+        def copy_file(file: File) -> None:
+            if dirty and _checks_mtimes(file):
+                dest_mtime = dest_mtimes.get(file.abs_dest_path)
+                if dest_mtime is not None and dest_mtime >= os.path.getmtime(file.abs_src_path):
+                    log.debug(f"Skip copying unmodified file: '{file.src_uri}'")
+                else:
+                    file.copy_file()
+            else:
                 file.copy_file(dirty)
 
+        # Copying is I/O bound (and releases the GIL), so copy several files at a time.
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Consume the results, so that an exception from any copy is raised here.
+            list(executor.map(copy_file, static_files))
+
     def documentation_pages(self) -> Sequence[File]:
         """Return iterable of all Markdown page file objects."""
         return [file for file in self if file.is_documentation_page()]
@@ -95,23 +160,49 @@ class Files:
     def add_files_from_theme(self, env: jinja2.Environment, config: Config) -> None:
         """Retrieve static files from Jinja environment and add to collection."""
 
+        # '.*' filters dot files/dirs at root level whereas '*/.*' filters nested levels
+        patterns = ['.*', '*/.*', '*.py', '*.pyc', '*.html', '*readme*', 'mkdocs_theme.yml']
+        # Exclude translation files
+        patterns.append("locales/*")
+        patterns.extend(f'*{x}' for x in utils.markdown_extensions)
+        patterns.extend(config['theme'].static_templates)
+        exclude_re = _compile_patterns(patterns)
+
         def filter(name):
-            # '.*' filters dot files/dirs at root level whereas '*/.*' filters nested levels
-            patterns = ['.*', '*/.*', '*.py', '*.pyc', '*.html', '*readme*', 'mkdocs_theme.yml']
-            # Exclude translation files
-            patterns.append("locales/*")
-            patterns.extend(f'*{x}' for x in utils.markdown_extensions)
-            patterns.extend(config['theme'].static_templates)
-            for pattern in patterns:
-                if fnmatch.fnmatch(name.lower(), pattern):
-                    return False
-            return True
+            return not exclude_re.match(os.path.normcase(name.lower()))
+
+        theme_dirs = config['theme'].dirs
+        loader = env.loader
+        if (
+            isinstance(loader, jinja2.FileSystemLoader)
+            and not loader.followlinks
+            and loader.searchpath == [os.fspath(dir) for dir in theme_dirs]
+        ):
+            # The loader would list the files in the theme dirs, so scan each of them just once.
+            # Take each path from the first theme dir which contains it.
+            theme_files: Dict[str, str] = {}
+            for dir in theme_dirs:
+                for path, abs_path in _get_file_paths(dir).items():
+                    theme_files.setdefault(path, abs_path)
+
+            for path in sorted(theme_files):
+                # Theme files do not override docs_dir files
+                if filter(path) and path not in self.src_uris:
+                    self.append(
+                        File._from_scan(
+                            path,
+                            theme_files[path],
+                            config['site_dir'],
+                            config['use_directory_urls'],
+                        )
+                    )
+            return
 
         for path in env.list_templates(filter_func=filter):
             # Theme files do not override docs_dir files
             path = PurePath(path).as_posix()
             if path not in self.src_uris:
-                for dir in config['theme'].dirs:
+                for dir in theme_dirs:
                     # Find the first theme dir which contains path
                     if os.path.isfile(os.path.join(dir, path)):
                         self.append(
@@ -138,14 +229,35 @@ class File:
     File objects have the following properties, which are Unicode strings:
     """
 
-    src_uri: str
-    """The pure path (always '/'-separated) of the source file relative to the source directory."""
+    @property
+    def src_uri(self) -> str:
+        """The pure path (always '/'-separated) of the source file relative to the source directory."""
+        return self._src_uri
+
+    @src_uri.setter
+    def src_uri(self, value: str):
+        old_src_uri = self.__dict__.get('_src_uri')
+        self._src_uri = value
+        self._src_path: Optional[str] = None
+        self._kind = _get_kind(value)
+        if old_src_uri is not None:
+            for ref in self.__dict__.get('_collections', ()):
+                files = ref()
+                if files is not None:
+                    files._src_uri_changed(self, old_src_uri)
 
     abs_src_path: str
     """The absolute concrete path of the source file. Will use backslashes on Windows."""
 
-    dest_uri: str
-    """The pure path (always '/'-separated) of the destination file relative to the destination directory."""
+    @property
+    def dest_uri(self) -> str:
+        """The pure path (always '/'-separated) of the destination file relative to the destination directory."""
+        return self._dest_uri
+
+    @dest_uri.setter
+    def dest_uri(self, value: str):
+        self._dest_uri = value
+        self._dest_path: Optional[str] = None
 
     abs_dest_path: str
     """The absolute concrete path of the destination file. Will use backslashes on Windows."""
@@ -156,7 +268,9 @@ class File:
     @property
     def src_path(self) -> str:
         """Same as `src_uri` (and synchronized with it) but will use backslashes on Windows. Discouraged."""
-        return os.path.normpath(self.src_uri)
+        if self._src_path is None:
+            self._src_path = os.path.normpath(self.src_uri)
+        return self._src_path
 
     @src_path.setter
     def src_path(self, value):
@@ -165,7 +279,9 @@ class File:
     @property
     def dest_path(self) -> str:
         """Same as `dest_uri` (and synchronized with it) but will use backslashes on Windows. Discouraged."""
-        return os.path.normpath(self.dest_uri)
+        if self._dest_path is None:
+            self._dest_path = os.path.normpath(self.dest_uri)
+        return self._dest_path
 
     @dest_path.setter
     def dest_path(self, value):
@@ -177,11 +293,47 @@ class File:
         self.page = None
         self.src_path = path
         self.abs_src_path = os.path.normpath(os.path.join(src_dir, self.src_path))
+        self._set_dest(dest_dir, use_directory_urls)
+
+    @classmethod
+    def _from_scan(
+        cls, src_uri: str, abs_src_path: str, dest_dir: str, use_directory_urls: bool
+    ) -> File:
+        """Create a File from a directory scan, which already knows its normalized paths.
+
+        Unlike the constructor, this doesn't normalize `src_uri` nor derive `abs_src_path` from it."""
+        file = cls.__new__(cls)
+        file.page = None
+        file.src_uri = src_uri
+        file.abs_src_path = abs_src_path
+        file._set_dest(dest_dir, use_directory_urls)
+        return file
+
+    def _set_dest(self, dest_dir: str, use_directory_urls: bool) -> None:
         self.name = self._get_stem()
         self.dest_uri = self._get_dest_path(use_directory_urls)
         self.abs_dest_path = os.path.normpath(os.path.join(dest_dir, self.dest_path))
         self.url = self._get_url(use_directory_urls)
 
+    def _add_collection(self, files: Files) -> None:
+        """Let `files`, which now contains this file, follow changes of its `src_uri`."""
+        refs = self.__dict__.setdefault('_collections', [])
+        refs[:] = [ref for ref in refs if ref() is not None]
+        refs.append(weakref.ref(files))
+
+    def _remove_collection(self, files: Files) -> None:
+        refs = self.__dict__.get('_collections', [])
+        for i, ref in enumerate(refs):
+            if ref() is files:
+                del refs[i]
+                break
+
+    def __getstate__(self):
+        # The references to the containing collections can't be pickled.
+        state = self.__dict__.copy()
+        state.pop('_collections', None)
+        return state
+
     def __eq__(self, other) -> bool:
         return (
             isinstance(other, self.__class__)
@@ -224,6 +376,8 @@ class File:
                 url = '.'
             else:
                 url = dirname + '/'
+        if _is_url_safe(url):
+            return url
         return urlquote(url)
 
     def url_relative_to(self, other: File) -> str:
@@ -248,11 +402,11 @@ class File:
 
     def is_documentation_page(self) -> bool:
         """Return True if file is a Markdown page."""
-        return utils.is_markdown_file(self.src_uri)
+        return self._kind == _DOCUMENTATION_PAGE
 
     def is_static_page(self) -> bool:
         """Return True if file is a static page (HTML, XML, JSON)."""
-        return self.src_uri.endswith(('.html', '.htm', '.xml', '.json'))
+        return self._kind == _STATIC_PAGE
 
     def is_media_file(self) -> bool:
         """Return True if file is not a documentation or static page."""
@@ -260,32 +414,76 @@ class File:
 
     def is_javascript(self) -> bool:
         """Return True if file is a JavaScript file."""
-        return self.src_uri.endswith(('.js', '.javascript'))
+        return self._kind == _JAVASCRIPT
 
     def is_css(self) -> bool:
         """Return True if file is a CSS file."""
-        return self.src_uri.endswith('.css')
+        return self._kind == _CSS
+
+
+# The kinds of files, as determined by the extension of their `src_uri`.
+_DOCUMENTATION_PAGE, _STATIC_PAGE, _MEDIA_FILE, _JAVASCRIPT, _CSS = range(5)
+
+_STATIC_PAGE_EXTENSIONS = frozenset({'.html', '.htm', '.xml', '.json'})
+_JAVASCRIPT_EXTENSIONS = frozenset({'.js', '.javascript'})
+_CSS_EXTENSIONS = frozenset({'.css'})
+
+_KINDS_BY_EXTENSION = {
+    **dict.fromkeys(utils.markdown_extensions, _DOCUMENTATION_PAGE),
+    **dict.fromkeys(_STATIC_PAGE_EXTENSIONS, _STATIC_PAGE),
+    **dict.fromkeys(_JAVASCRIPT_EXTENSIONS, _JAVASCRIPT),
+    **dict.fromkeys(_CSS_EXTENSIONS, _CSS),
+}
+
+
+# Matches URLs which `urllib.parse.quote` would return unchanged.
+_is_url_safe = re.compile(r'[A-Za-z0-9_.\-~/]*').fullmatch
+
+
+def _get_kind(src_uri: str) -> int:
+    """Classify a file by its extension (i.e. the part of `src_uri` from the last '.')."""
+    dot = src_uri.rfind('.')
+    if dot == -1:
+        return _MEDIA_FILE
+    return _KINDS_BY_EXTENSION.get(src_uri[dot:], _MEDIA_FILE)
 
 
 def get_files(config: Config) -> Files:
     """Walk the `docs_dir` and return a Files collection."""
     files = []
-    exclude = ['.*', '/templates']
-
-    for source_dir, dirnames, filenames in os.walk(config['docs_dir'], followlinks=True):
-        relative_dir = os.path.relpath(source_dir, config['docs_dir'])
+    exclude = ('.*', '/templates')
+
+    # Directories which remain to be scanned, as `(source_dir, relative_uri)` pairs. The next one
+    # to scan is last, so that the files are collected in the same (depth first) order as `os.walk`.
+    pending_dirs = [(config['docs_dir'], '')]
+    while pending_dirs:
+        source_dir, relative_uri = pending_dirs.pop()
+        dirnames, filenames = [], []
+        try:
+            with os.scandir(source_dir) as entries:
+                for entry in entries:
+                    # Like `os.walk(followlinks=True)`, `is_dir` follows symlinks, and an entry
+                    # which can't be checked counts as a file.
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    (dirnames if is_dir else filenames).append(entry.name)
+        except OSError:
+            continue
 
-        for dirname in list(dirnames):
-            path = os.path.normpath(os.path.join(relative_dir, dirname))
+        subdirs = []
+        for dirname in sorted(dirnames):
+            uri = posixpath.join(relative_uri, dirname)
             # Skip any excluded directories
-            if _filter_paths(basename=dirname, path=path, is_dir=True, exclude=exclude):
-                dirnames.remove(dirname)
-        dirnames.sort()
+            if not _filter_paths(basename=dirname, path=uri, is_dir=True, exclude=exclude):
+                subdirs.append((os.path.join(source_dir, dirname), uri))
+        pending_dirs.extend(reversed(subdirs))
 
         for filename in _sort_files(filenames):
-            path = os.path.normpath(os.path.join(relative_dir, filename))
+            uri = posixpath.join(relative_uri, filename)
             # Skip any excluded files
-            if _filter_paths(basename=filename, path=path, is_dir=False, exclude=exclude):
+            if _filter_paths(basename=filename, path=uri, is_dir=False, exclude=exclude):
                 continue
             # Skip README.md if an index file also exists in dir
             if filename == 'README.md' and 'index.md' in filenames:
@@ -294,32 +492,100 @@ def get_files(config: Config) -> Files:
                 )
                 continue
             files.append(
-                File(path, config['docs_dir'], config['site_dir'], config['use_directory_urls'])
+                File._from_scan(
+                    uri,
+                    os.path.join(source_dir, filename),
+                    config['site_dir'],
+                    config['use_directory_urls'],
+                )
             )
 
     return Files(files)
 
 
+def _get_file_paths(dir: str) -> Dict[str, str]:
+    """Map the '/'-separated paths of all files within `dir`, relative to it, to their absolute paths.
+
+    As with `jinja2.FileSystemLoader.list_templates`, symlinked directories are not followed."""
+    paths = {}
+    pending_dirs = [(os.path.normpath(dir), '')]
+    while pending_dirs:
+        source_dir, prefix = pending_dirs.pop()
+        try:
+            with os.scandir(source_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending_dirs.append((entry.path, f'{prefix}{entry.name}/'))
+                    elif entry.is_file():
+                        paths[prefix + entry.name] = entry.path
+        except OSError:
+            pass
+    return paths
+
+
+def _checks_mtimes(file: File) -> bool:
+    """Whether copying `file` uses the default `File.copy_file` and `File.is_modified`."""
+    return (
+        getattr(file.copy_file, '__func__', None) is File.copy_file
+        and getattr(file.is_modified, '__func__', None) is File.is_modified
+    )
+
+
+def _get_dest_mtimes(files: Iterable[File]) -> Dict[str, float]:
+    """Return the modification times of the existing destination files, keyed by `abs_dest_path`.
+
+    Each destination directory is listed only once, rather than checking every file separately."""
+    dest_paths_by_dir: Dict[str, Set[str]] = defaultdict(set)
+    for file in files:
+        dest_paths_by_dir[os.path.dirname(file.abs_dest_path)].add(file.abs_dest_path)
+
+    dest_mtimes = {}
+    for dir, dest_paths in dest_paths_by_dir.items():
+        try:
+            with os.scandir(dir) as entries:
+                for entry in entries:
+                    if entry.path in dest_paths and entry.is_file():
+                        dest_mtimes[entry.path] = entry.stat().st_mtime
+        except FileNotFoundError:
+            pass
+    return dest_mtimes
+
+
 def _sort_files(filenames: Iterable[str]) -> List[str]:
     """Always sort `index` or `README` as first filename in list."""
+    first, rest = [], []
+    for f in filenames:
+        (first if os.path.splitext(f)[0] in ('index', 'README') else rest).append(f)
+    rest.sort()
+    return first + rest
 
-    def key(f):
-        if os.path.splitext(f)[0] in ['index', 'README']:
-            return (0,)
-        return (1, f)
 
-    return sorted(filenames, key=key)
+def _compile_patterns(patterns: Iterable[str]) -> Pattern:
+    """Compile `fnmatch` style patterns into a single regex which matches any of them."""
+    return re.compile('|'.join(fnmatch.translate(os.path.normcase(p)) for p in patterns) or '(?!)')
 
 
-def _filter_paths(basename: str, path: str, is_dir: bool, exclude: Iterable[str]) -> bool:
-    """.gitignore style file filtering."""
+@functools.lru_cache(maxsize=None)
+def _compile_exclude(exclude: Tuple[str, ...]) -> Dict[Tuple[bool, bool], Pattern]:
+    """Compile .gitignore style patterns into regexes keyed by `(is_dir, matches_whole_path)`."""
+    groups: Dict[Tuple[bool, bool], List[str]] = {
+        (is_dir, whole_path): [] for is_dir in (False, True) for whole_path in (False, True)
+    }
     for item in exclude:
-        # Items ending in '/' apply only to directories.
-        if item.endswith('/') and not is_dir:
-            continue
         # Items starting with '/' apply to the whole path.
         # In any other cases just the basename is used.
-        match = path if item.startswith('/') else basename
-        if fnmatch.fnmatch(match, item.strip('/')):
-            return True
-    return False
+        whole_path = item.startswith('/')
+        groups[True, whole_path].append(item.strip('/'))
+        # Items ending in '/' apply only to directories.
+        if not item.endswith('/'):
+            groups[False, whole_path].append(item.strip('/'))
+    return {key: _compile_patterns(items) for key, items in groups.items()}
+
+
+def _filter_paths(basename: str, path: str, is_dir: bool, exclude: Iterable[str]) -> bool:
+    """.gitignore style file filtering."""
+    patterns = _compile_exclude(tuple(exclude))
+    return bool(
+        patterns[is_dir, False].match(os.path.normcase(basename))
+        or patterns[is_dir, True].match(os.path.normcase(path))
+    )
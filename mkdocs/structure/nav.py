@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import logging
-from typing import Iterator, List, Optional, Type, TypeVar, Union
+from typing import Any, Iterator, List, Optional, Tuple, Type, TypeVar, Union
 from urllib.parse import urlsplit
 
 from mkdocs.config.base import Config
+from mkdocs.structure import get_ancestors
 from mkdocs.structure.files import Files
 from mkdocs.structure.pages import Page
 from mkdocs.utils import nest_paths
@@ -71,9 +72,11 @@ class Section:
     @active.setter
     def active(self, value: bool):
         """Set active status of section and ancestors."""
-        self.__active = bool(value)
-        if self.parent is not None:
-            self.parent.active = bool(value)
+        value = bool(value)
+        node: Optional[Section] = self
+        while node is not None:
+            node.__active = value
+            node = node.parent
 
     is_section: bool = True
     """Indicates that the navigation object is a "section" object. Always `True` for section objects."""
@@ -86,14 +89,19 @@ class Section:
 
     @property
     def ancestors(self):
-        if self.parent is None:
-            return []
-        return [self.parent] + self.parent.ancestors
+        return get_ancestors(self)
 
     def _indent_print(self, depth=0):
-        ret = ['{}{}'.format('    ' * depth, repr(self))]
-        for item in self.children:
-            ret.append(item._indent_print(depth + 1))
+        # Collect the lines of the whole subtree and join them once, rather than joining per level.
+        ret = []
+        stack: List[Tuple[Union[Page, Section, Link], int]] = [(self, depth)]
+        while stack:
+            item, depth = stack.pop()
+            if isinstance(item, Section):
+                ret.append('{}{}'.format('    ' * depth, repr(item)))
+                stack.extend((child, depth + 1) for child in reversed(item.children))
+            else:
+                ret.append(item._indent_print(depth))
         return '\n'.join(ret)
 
 
@@ -134,9 +142,7 @@ class Link:
 
     @property
     def ancestors(self):
-        if self.parent is None:
-            return []
-        return [self.parent] + self.parent.ancestors
+        return get_ancestors(self)
 
     def _indent_print(self, depth=0):
         return '{}{}'.format('    ' * depth, repr(self))
@@ -149,12 +155,11 @@ def get_navigation(files: Files, config: Config) -> Navigation:
     if not isinstance(items, list):
         items = [items]
 
-    # Get only the pages from the navigation, ignoring any sections and links.
-    pages = _get_by_type(items, Page)
+    # Get the pages and links from the navigation, setting parent links along the way.
+    pages, links = _walk_nav(items)
 
-    # Include next, previous and parent links.
+    # Include next and previous links.
     _add_previous_and_next_links(pages)
-    _add_parent_links(items)
 
     missing_from_config = [file for file in files.documentation_pages() if file.page is None]
     if missing_from_config:
@@ -170,10 +175,8 @@ def get_navigation(files: Files, config: Config) -> Navigation:
         for file in missing_from_config:
             Page(None, file, config)
 
-    links = _get_by_type(items, Link)
     for link in links:
-        scheme, netloc, path, query, fragment = urlsplit(link.url)
-        if scheme or netloc:
+        if _is_external_url(link.url):
             log.debug(f"An external link to '{link.url}' is included in the 'nav' configuration.")
         elif link.url.startswith('/'):
             log.debug(
@@ -190,20 +193,46 @@ def get_navigation(files: Files, config: Config) -> Navigation:
 
 
 def _data_to_navigation(data, files: Files, config: Config):
+    if not isinstance(data, (dict, list)):
+        return _data_to_nav_item(data, files, config)
+    # Build the nested lists depth first without recursion. Each level on the stack is an
+    # iterator over the entries of a dict or list, and the preallocated list to fill in.
+    result: list = [None] * len(data)
+    stack = [(enumerate(_nav_entries(data)), result)]
+    while stack:
+        entries, out = stack[-1]
+        for i, (is_pair, key, value) in entries:
+            if isinstance(value, (dict, list)):
+                children: list = [None] * len(value)
+                out[i] = Section(title=key, children=children) if is_pair else children
+                stack.append((enumerate(_nav_entries(value)), children))
+                break
+            if not is_pair:
+                out[i] = _data_to_nav_item(value, files, config)
+            elif isinstance(value, str):
+                out[i] = _data_to_nav_item((key, value), files, config)
+            else:
+                out[i] = Section(title=key, children=_data_to_nav_item(value, files, config))
+        else:
+            stack.pop()
+    return result
+
+
+def _nav_entries(data: Union[dict, list]) -> Iterator[Tuple[bool, Any, Any]]:
+    """Yield `(is_pair, key, value)` for each entry, where a single key dict in a list is a pair."""
     if isinstance(data, dict):
-        return [
-            _data_to_navigation((key, value), files, config)
-            if isinstance(value, str)
-            else Section(title=key, children=_data_to_navigation(value, files, config))
-            for key, value in data.items()
-        ]
-    elif isinstance(data, list):
-        return [
-            _data_to_navigation(item, files, config)[0]
-            if isinstance(item, dict) and len(item) == 1
-            else _data_to_navigation(item, files, config)
-            for item in data
-        ]
+        for key, value in data.items():
+            yield True, key, value
+    else:
+        for item in data:
+            if isinstance(item, dict) and len(item) == 1:
+                ((key, value),) = item.items()
+                yield True, key, value
+            else:
+                yield False, None, item
+
+
+def _data_to_nav_item(data, files: Files, config: Config) -> Union[Page, Link]:
     title, path = data if isinstance(data, tuple) else (None, data)
     file = files.get_file_from_path(path)
     if file:
@@ -211,29 +240,63 @@ def _data_to_navigation(data, files: Files, config: Config):
     return Link(title, path)
 
 
+def _is_external_url(url: str) -> bool:
+    """Return True if `urlsplit` would find a scheme or a netloc in the url."""
+    # Settle the usual web links and relative paths without parsing the url.
+    if url.startswith(('https://', 'http://')):
+        return True
+    if ':' not in url and url[:1] > ' ' and url[:1] != '/':
+        return False
+    scheme, netloc, path, query, fragment = urlsplit(url)
+    return bool(scheme or netloc)
+
+
 T = TypeVar('T')
 
 
 def _get_by_type(nav, T: Type[T]) -> List[T]:
     ret = []
-    for item in nav:
-        if isinstance(item, T):
-            ret.append(item)
-        if item.children:
-            ret.extend(_get_by_type(item.children, T))
+    # Walk the tree depth first without recursion, keeping an iterator for each level.
+    stack = [iter(nav)]
+    while stack:
+        for item in stack[-1]:
+            if isinstance(item, T):
+                ret.append(item)
+            if item.children:
+                stack.append(iter(item.children))
+                break
+        else:
+            stack.pop()
     return ret
 
 
-def _add_parent_links(nav) -> None:
-    for item in nav:
-        if item.is_section:
-            for child in item.children:
-                child.parent = item
-            _add_parent_links(item.children)
+def _walk_nav(nav) -> Tuple[List[Page], List[Link]]:
+    """Collect the pages and links in order, and set the parent of nested items, in a single pass."""
+    pages: List[Page] = []
+    links: List[Link] = []
+    stack = [iter(nav)]
+    while stack:
+        for item in stack[-1]:
+            if isinstance(item, Page):
+                pages.append(item)
+            elif isinstance(item, Link):
+                links.append(item)
+            elif item.is_section:
+                for child in item.children:
+                    child.parent = item
+                stack.append(iter(item.children))
+                break
+        else:
+            stack.pop()
+    return pages, links
 
 
 def _add_previous_and_next_links(pages: List[Page]) -> None:
-    bookended = [None, *pages, None]
-    zipped = zip(bookended[:-2], pages, bookended[2:])
-    for page0, page1, page2 in zipped:
-        page1.previous_page, page1.next_page = page0, page2
+    previous_page: Optional[Page] = None
+    for page in pages:
+        page.previous_page = previous_page
+        if previous_page is not None:
+            previous_page.next_page = page
+        previous_page = page
+    if previous_page is not None:
+        previous_page.next_page = None
@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 import os
 import posixpath
-from typing import TYPE_CHECKING, Any, Mapping, Optional
+from typing import TYPE_CHECKING, Any, Mapping, Optional, Tuple
 from urllib.parse import unquote as urlunquote
 from urllib.parse import urljoin, urlsplit, urlunsplit
 from xml.etree.ElementTree import Element
@@ -14,9 +14,10 @@ from markdown.treeprocessors import Treeprocessor
 from markdown.util import AMP_SUBSTITUTE
 
 from mkdocs.config.base import Config
+from mkdocs.structure import get_ancestors
 from mkdocs.structure.files import File, Files
 from mkdocs.structure.toc import get_toc
-from mkdocs.utils import get_build_date, get_markdown_title, meta
+from mkdocs.utils import get_build_date, get_markdown_title, get_url_dir_parts, meta
 
 if TYPE_CHECKING:
     from mkdocs.structure.nav import Section
@@ -87,6 +88,18 @@ class Page:
         """The URL of the page relative to the MkDocs `site_dir`."""
         return '' if self.file.url == '.' else self.file.url
 
+    __url_dir_parts_for: Optional[str] = None
+    __url_dir_parts: Tuple[str, ...]
+
+    @property
+    def _url_dir_parts(self) -> Tuple[str, ...]:
+        """The normalized directory parts of `url`, kept to compute URLs relative to this page."""
+        url = self.url
+        if url != self.__url_dir_parts_for:
+            self.__url_dir_parts = get_url_dir_parts(url)
+            self.__url_dir_parts_for = url
+        return self.__url_dir_parts
+
     file: File
     """The documentation [`File`][mkdocs.structure.files.File] that the page is being rendered from."""
 
@@ -160,9 +173,7 @@ class Page:
 
     @property
     def ancestors(self):
-        if self.parent is None:
-            return []
-        return [self.parent] + self.parent.ancestors
+        return get_ancestors(self)
 
     def _set_canonical_url(self, base: Optional[str]) -> None:
         if base:
@@ -2,12 +2,14 @@
 
 import io
 import logging
+import textwrap
 import unittest
 from unittest import mock
 
 from click.testing import CliRunner
 
 from mkdocs import __main__ as cli
+from mkdocs._cli_commands import LazyChoice
 
 
 class CLITests(unittest.TestCase):
@@ -624,3 +626,53 @@ class CLITests(unittest.TestCase):
             use_directory_urls=None,
             site_dir='custom',
         )
+
+    def test_lazy_choice(self):
+        get_choices = mock.Mock(return_value=['mkdocs', 'readthedocs'])
+        choice = LazyChoice(get_choices)
+        get_choices.assert_not_called()
+
+        self.assertEqual(choice.convert('readthedocs', None, None), 'readthedocs')
+        self.assertEqual(choice.choices, ('mkdocs', 'readthedocs'))
+        get_choices.assert_called_once_with()
+
+    def test_color_formatter_wrap_line(self):
+        formatter = cli.ColorFormatter()
+        formatter.text_wrapper = textwrap.TextWrapper(
+            width=30,
+            replace_whitespace=False,
+            break_long_words=False,
+            break_on_hyphens=False,
+            initial_indent=' ' * 12,
+            subsequent_indent=' ' * 12,
+        )
+        for line in [
+            '',
+            '   ',
+            'short',
+            '  indented',
+            'trailing  ',
+            'a\ttab',
+            'too long to fit in a line',
+        ]:
+            with self.subTest(line=line):
+                self.assertEqual(formatter._wrap_line(line), formatter.text_wrapper.fill(line))
+
+    def test_state_close(self):
+        state = cli.State(log_name='mkdocs.test_state')
+        stream = io.StringIO()
+        state.stream.setStream(stream)
+        logger = logging.getLogger('mkdocs.test_state')
+        logger.debug('hidden message')
+        logger.info('queued message')
+        state.close()
+        self.assertIn('queued message', stream.getvalue())
+        self.assertNotIn('hidden message', stream.getvalue())
+        self.assertNotIn(state.queue_handler, logger.handlers)
+        logger.debug('hidden message')
+        logger.info('direct message')
+        self.assertIn('direct message', stream.getvalue())
+        self.assertNotIn('hidden message', stream.getvalue())
+        state.close()
+        self.assertEqual(logger.handlers.count(state.stream), 1)
+        logger.removeHandler(state.stream)
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 
 import json
+import os
 import unittest
 from unittest import mock
 
@@ -256,6 +257,20 @@ class SearchPluginTests(unittest.TestCase):
         self.assertEqual(mock_copy_file.call_count, 4)
         self.assertEqual(mock_write_file.call_count, 1)
 
+    @mock.patch('mkdocs.utils.write_file', autospec=True)
+    @mock.patch('mkdocs.utils.copy_file', autospec=True)
+    def test_event_on_post_build_duplicate_lang(self, mock_copy_file, mock_write_file):
+        plugin = search.SearchPlugin()
+        plugin.load_config({'lang': ['ja', 'ja']})
+        config = load_config(theme='mkdocs')
+        plugin.on_pre_build(config)
+        plugin.on_post_build(config)
+        copied = [os.path.basename(args[0]) for args, kwargs in mock_copy_file.call_args_list]
+        self.assertEqual(
+            copied, ['lunr.stemmer.support.js', 'lunr.multi.js', 'tinyseg.js', 'lunr.ja.js']
+        )
+        self.assertEqual(mock_write_file.call_count, 1)
+
     @mock.patch('mkdocs.utils.write_file', autospec=True)
     @mock.patch('mkdocs.utils.copy_file', autospec=True)
     def test_event_on_post_build_search_index_only(self, mock_copy_file, mock_write_file):
@@ -3,6 +3,8 @@ import sys
 import unittest
 from unittest import mock
 
+import jinja2
+
 from mkdocs.structure.files import File, Files, _filter_paths, _sort_files, get_files
 from mkdocs.tests.base import PathAssertionMixin, load_config, tempdir
 
@@ -47,6 +49,18 @@ class TestFiles(PathAssertionMixin, unittest.TestCase):
         self.assertEqual(f.src_uri, 'foo\\e.md')
         self.assertEqual(f.src_path, 'foo\\e.md')
 
+    def test_src_path_dest_path_synchronized(self):
+        f = File('foo/a.md', '/path/to/docs', '/path/to/site', use_directory_urls=False)
+        self.assertPathsEqual(f.src_path, 'foo/a.md')
+        self.assertPathsEqual(f.dest_path, 'foo/a.html')
+        f.src_uri = 'foo/b.md'
+        self.assertPathsEqual(f.src_path, 'foo/b.md')
+        f.dest_uri = 'foo/b.html'
+        self.assertPathsEqual(f.dest_path, 'foo/b.html')
+        f.dest_path = 'foo/c.html'
+        self.assertEqual(f.dest_uri, 'foo/c.html')
+        self.assertPathsEqual(f.dest_path, 'foo/c.html')
+
     def test_sort_files(self):
         self.assertEqual(
             _sort_files(['b.md', 'bb.md', 'a.md', 'index.md', 'aa.md']),
@@ -330,6 +344,21 @@ class TestFiles(PathAssertionMixin, unittest.TestCase):
         self.assertFalse(f.is_javascript())
         self.assertTrue(f.is_css())
 
+    def test_file_kind_follows_src_uri(self):
+        f = File('foo/bar.txt', '/path/to/docs', '/path/to/site', use_directory_urls=False)
+        self.assertTrue(f.is_media_file())
+        f.src_uri = 'foo/bar.md'
+        self.assertTrue(f.is_documentation_page())
+        self.assertFalse(f.is_media_file())
+        f.src_path = 'foo/bar.js'
+        self.assertTrue(f.is_javascript())
+        self.assertTrue(f.is_media_file())
+        f.src_uri = '.md'
+        self.assertTrue(f.is_documentation_page())
+        f.src_uri = 'foo.d/bar'
+        self.assertTrue(f.is_media_file())
+        self.assertFalse(f.is_documentation_page())
+
     def test_file_name_with_space(self):
         f = File('foo bar.md', '/path/to/docs', '/path/to/site', use_directory_urls=False)
         self.assertEqual(f.src_uri, 'foo bar.md')
@@ -406,6 +435,20 @@ class TestFiles(PathAssertionMixin, unittest.TestCase):
             os.path.normpath(os.path.join(ddir, 'favicon.ico')),
         )
 
+    @tempdir(files=['index.md'])
+    @tempdir(files=['style.css', 'script.js'])
+    def test_add_files_from_theme_custom_loader(self, tdir, ddir):
+        config = load_config(docs_dir=ddir, theme={'name': None, 'custom_dir': tdir})
+        env = jinja2.Environment(
+            loader=jinja2.ChoiceLoader([jinja2.DictLoader({'style.css': '', 'missing.css': ''})])
+        )
+        files = get_files(config)
+        files.add_files_from_theme(env, config)
+        self.assertEqual([file.src_uri for file in files], ['index.md', 'style.css'])
+        self.assertPathsEqual(
+            files.get_file_from_path('style.css').abs_src_path, os.path.join(tdir, 'style.css')
+        )
+
     def test_filter_paths(self):
         # Root level file
         self.assertFalse(_filter_paths('foo.md', 'foo.md', False, ['bar.md']))
@@ -645,6 +688,14 @@ class TestFiles(PathAssertionMixin, unittest.TestCase):
         self.assertEqual(len(files), len(expected))
         self.assertEqual([f.src_path for f in files], expected)
 
+    @unittest.skipIf(sys.platform.startswith("win"), "requires symlinks")
+    @tempdir(files=['index.md', 'foo.md'])
+    def test_get_files_symlink_loop(self, tdir):
+        os.symlink('loop', os.path.join(tdir, 'loop'))
+        config = load_config(docs_dir=tdir)
+        files = get_files(config)
+        self.assertEqual([f.src_path for f in files], ['index.md', 'foo.md', 'loop'])
+
     @tempdir(
         files=[
             'README.md',
@@ -730,6 +781,102 @@ class TestFiles(PathAssertionMixin, unittest.TestCase):
         with open(dest_path, encoding='utf-8') as f:
             self.assertEqual(f.read(), 'destination content')
 
+    @tempdir(files={'foo/old.txt': 'destination content'})
+    @tempdir(files={'foo/old.txt': 'source content', 'foo/new.txt': 'new content'})
+    def test_copy_static_files_dirty(self, src_dir, dest_dir):
+        old_dest_path = os.path.join(dest_dir, 'foo', 'old.txt')
+        os.utime(os.path.join(src_dir, 'foo', 'old.txt'), (0, 0))
+        files = Files(
+            [
+                File('foo/old.txt', src_dir, dest_dir, use_directory_urls=False),
+                File('foo/new.txt', src_dir, dest_dir, use_directory_urls=False),
+            ]
+        )
+        files.copy_static_files(dirty=True)
+        with open(old_dest_path, encoding='utf-8') as f:
+            self.assertEqual(f.read(), 'destination content')
+        self.assertPathIsFile(os.path.join(dest_dir, 'foo', 'new.txt'))
+
+    @tempdir(files={'foo/old.txt': 'destination content'})
+    @tempdir(files={'foo/old.txt': 'source content', 'foo/new.txt': 'new content'})
+    def test_copy_static_files_dirty_custom_file(self, src_dir, dest_dir):
+        class ModifiedFile(File):
+            def is_modified(self):
+                return True
+
+        class CustomFile(File):
+            def copy_file(self, dirty=False):
+                self.copied_dirty = dirty
+
+        old_file = ModifiedFile('foo/old.txt', src_dir, dest_dir, use_directory_urls=False)
+        new_file = CustomFile('foo/new.txt', src_dir, dest_dir, use_directory_urls=False)
+        os.utime(old_file.abs_src_path, (0, 0))
+        Files([old_file, new_file]).copy_static_files(dirty=True)
+        with open(old_file.abs_dest_path, encoding='utf-8') as f:
+            self.assertEqual(f.read(), 'source content')
+        self.assertTrue(new_file.copied_dirty)
+        self.assertPathNotExists(new_file.abs_dest_path)
+
+    def test_files_append_remove_filtered(self):
+        class NotebookFile(File):
+            def is_documentation_page(self):
+                return True
+
+        files = Files(
+            [
+                File('index.md', '/path/to/docs', '/path/to/site', use_directory_urls=True),
+                File('foo/bar.js', '/path/to/docs', '/path/to/site', use_directory_urls=True),
+            ]
+        )
+        notebook = NotebookFile('nb.ipynb', '/path/to/docs', '/path/to/site', True)
+        files.append(notebook)
+        self.assertEqual([f.src_uri for f in files.documentation_pages()], ['index.md', 'nb.ipynb'])
+        self.assertEqual([f.src_uri for f in files.javascript_files()], ['foo/bar.js'])
+        self.assertFalse(notebook.is_media_file())
+        self.assertEqual([f.src_uri for f in files.media_files()], ['foo/bar.js'])
+        files.remove(notebook)
+        self.assertEqual([f.src_uri for f in files.documentation_pages()], ['index.md'])
+        files.documentation_pages().clear()
+        self.assertEqual(len(files.documentation_pages()), 1)
+
+    def test_files_follow_src_uri_change(self):
+        f = File('a.txt', '/path/to/docs', '/path/to/site', use_directory_urls=True)
+        files = Files([f])
+        self.assertIn('a.txt', files)
+        f.src_uri = 'a.md'
+        files.append(File('b.css', '/path/to/docs', '/path/to/site', use_directory_urls=True))
+        self.assertIn('a.md', files)
+        self.assertNotIn('a.txt', files)
+        self.assertIs(files.get_file_from_path('a.md'), f)
+        self.assertIsNone(files.get_file_from_path('a.txt'))
+        self.assertEqual(list(files.src_uris), ['a.md', 'b.css'])
+        files.remove(f)
+        self.assertNotIn('a.md', files)
+        f.src_uri = 'b.css'
+        self.assertEqual(list(files.src_uris), ['b.css'])
+
+    def test_files_remove_duplicate_src_uri(self):
+        a1 = File('a.md', '/path/to/docs', '/path/to/site', use_directory_urls=True)
+        a2 = File('a.md', '/path/to/theme', '/path/to/site', use_directory_urls=True)
+        files = Files([a1, a2])
+        self.assertIs(files.get_file_from_path('a.md'), a2)
+        files.remove(a2)
+        self.assertIs(files.get_file_from_path('a.md'), a1)
+        files.remove(a1)
+        self.assertNotIn('a.md', files)
+
+    def test_files_filtered_follow_src_uri_change(self):
+        f = File('a.txt', '/path/to/docs', '/path/to/site', use_directory_urls=True)
+        files = Files([f])
+        self.assertEqual(files.media_files(), [f])
+        f.src_uri = 'a.md'
+        self.assertEqual(files.documentation_pages(), [f])
+        self.assertEqual(files.media_files(), [])
+        f.src_uri = 'a.css'
+        self.assertEqual(files.documentation_pages(), [])
+        self.assertEqual(files.css_files(), [f])
+        self.assertEqual(files.media_files(), [f])
+
     def test_files_append_remove_src_paths(self):
         fs = [
             File('index.md', '/path/to/docs', '/path/to/site', use_directory_urls=True),
@@ -475,3 +475,26 @@ class SiteNavigationTests(unittest.TestCase):
         files = Files(fs)
         site_navigation = get_navigation(files, cfg)
         self.assertEqual(len(_get_by_type(site_navigation, Section)), 2)
+
+    def test_ancestors_follow_parent(self):
+        nav_cfg = [
+            {'Section 1': [{'Section 2': [{'Page': 'page.md'}]}]},
+            {'Section 3': []},
+        ]
+        cfg = load_config(nav=nav_cfg, site_url='http://example.com/')
+        fs = [File('page.md', cfg['docs_dir'], cfg['site_dir'], cfg['use_directory_urls'])]
+        site_navigation = get_navigation(Files(fs), cfg)
+        section1, section3 = site_navigation.items
+        section2 = section1.children[0]
+        page = section2.children[0]
+        self.assertEqual(page.ancestors, [section2, section1])
+        page.ancestors.append('junk')
+        self.assertEqual(page.ancestors, [section2, section1])
+        # Moving a grandparent is reflected too.
+        section2.parent = section3
+        self.assertEqual(page.ancestors, [section2, section3])
+        self.assertEqual(section2.ancestors, [section3])
+        page.parent = section3
+        self.assertEqual(page.ancestors, [section3])
+        page.parent = None
+        self.assertEqual(page.ancestors, [])
@@ -38,6 +38,13 @@ deep1:
 
 
 class UtilsTests(unittest.TestCase):
+    def setUp(self):
+        # Some tests mock out the installed themes, which must not leak through the cache.
+        utils.get_themes.cache_clear()
+
+    def tearDown(self):
+        utils.get_themes.cache_clear()
+
     def test_is_markdown_file(self):
         expected_results = {
             'index.md': True,
@@ -279,12 +286,45 @@ class UtilsTests(unittest.TestCase):
                 urls = utils.create_media_urls(expected_results.keys(), page)
                 self.assertEqual([v[i] for v in expected_results.values()], urls)
 
+    def test_normalize_url_follows_page_url(self):
+        cfg = load_config(use_directory_urls=True)
+        file = File('foo/bar.md', cfg['docs_dir'], cfg['site_dir'], cfg['use_directory_urls'])
+        page = Page('FooBar', file, cfg)
+        self.assertEqual(utils.normalize_url('css/extra.css', page), '../../css/extra.css')
+        file.url = 'foo.html'
+        self.assertEqual(utils.normalize_url('css/extra.css', page), 'css/extra.css')
+
+    def test_normalize_url_page_like(self):
+        page = mock.Mock(spec=['url'], url='foo/bar/')
+        self.assertEqual(utils.normalize_url('css/extra.css', page), '../../css/extra.css')
+        self.assertEqual(utils.create_media_urls(['a.js'], page), ['../../a.js'])
+
+    def test_get_url_dir_parts(self):
+        self.assertEqual(utils.get_url_dir_parts('foo/bar/index.html'), ('foo', 'bar'))
+        self.assertEqual(utils.get_url_dir_parts('foo/../bar/'), ('bar',))
+        self.assertEqual(utils.get_url_dir_parts('index.html'), ())
+
     def test_reduce_list(self):
         self.assertEqual(
             utils.reduce_list([1, 2, 3, 4, 5, 5, 2, 4, 6, 7, 8]),
             [1, 2, 3, 4, 5, 6, 7, 8],
         )
 
+    def test_get_markdown_title(self):
+        for src, expected in [
+            ('# Title\nText', 'Title'),
+            ('  # Title  \r\nText', 'Title'),
+            ('\r\r  \n\t\n# Title\rText', 'Title'),
+            ('\n' * 100_000 + '# Title', 'Title'),
+            ('## Title', None),
+            ('Text\n# Title', None),
+            ('#Title', None),
+            (' \n \n', None),
+            ('', None),
+        ]:
+            with self.subTest(src=src[:20]):
+                self.assertEqual(utils.get_markdown_title(src), expected)
+
     def test_get_themes(self):
         themes = utils.get_theme_names()
         self.assertIn('mkdocs', themes)
@@ -458,6 +498,27 @@ class UtilsTests(unittest.TestCase):
             with self.assertRaises(exceptions.ConfigurationError):
                 utils.yaml_load(fd)
 
+    @tempdir(
+        files={
+            'base.yml': BASEYML,
+            'parent.yml': 'INHERIT: grandparent.yml\nfoo: foo\n',
+            'grandparent.yml': 'INHERIT: parent.yml\n',
+        }
+    )
+    def test_yaml_inheritance_loop(self, tdir):
+        with open(os.path.join(tdir, 'base.yml')) as fd:
+            with self.assertRaisesRegex(
+                exceptions.ConfigurationError,
+                r"Circular INHERIT chain: config file '.*parent\.yml'",
+            ):
+                utils.yaml_load(fd)
+
+    @tempdir(files=['index.html', '.hidden', 'sub/page.html', '.git/HEAD'])
+    def test_clean_directory(self, tdir):
+        utils.clean_directory(tdir)
+        self.assertEqual(sorted(os.listdir(tdir)), ['.git', '.hidden'])
+        self.assertTrue(os.path.isfile(os.path.join(tdir, '.git', 'HEAD')))
+
     @tempdir()
     @tempdir()
     def test_copy_files(self, src_dir, dst_dir):
@@ -489,6 +550,13 @@ class UtilsTests(unittest.TestCase):
                 utils.copy_file(src, dst)
                 self.assertTrue(os.path.isfile(os.path.join(dst_dir, expected)))
 
+    @tempdir()
+    @tempdir()
+    def test_copy_missing_file(self, src_dir, dst_dir):
+        with self.assertRaises(FileNotFoundError):
+            utils.copy_file(os.path.join(src_dir, 'foo.txt'), os.path.join(dst_dir, 'foo/foo.txt'))
+        self.assertEqual(os.listdir(dst_dir), [])
+
     @tempdir()
     @tempdir()
     def test_copy_files_without_permissions(self, src_dir, dst_dir):
@@ -10,7 +10,6 @@ import functools
 import logging
 import os
 import posixpath
-import re
 import shutil
 import sys
 import warnings
@@ -43,10 +42,17 @@ markdown_extensions = (
     '.mkd',
     '.md',
 )
+_MD_EXT_SET = frozenset(markdown_extensions)
 
 
+@functools.lru_cache(maxsize=None)
 def get_yaml_loader(loader=yaml.Loader):
-    """Wrap PyYaml's loader so we can extend it to suit our needs."""
+    """
+    Wrap PyYaml's loader so we can extend it to suit our needs.
+
+    The returned class is shared between calls with the same `loader`, so subclass
+    it before attaching any further constructors.
+    """
 
     class Loader(loader):
         """
@@ -65,17 +71,29 @@ def yaml_load(source: IO, loader=None) -> Optional[Dict[str, Any]]:
     """Return dict of source YAML file using loader, recursively deep merging inherited parent."""
     Loader = loader or get_yaml_loader()
     result = yaml.load(source, Loader=Loader)
-    if result is not None and 'INHERIT' in result:
+    # Follow the chain of inherited parents, then merge it in one go, from the root down.
+    chain = []
+    seen = set()
+    # The file the current `result` was read from, which its INHERIT path is relative to.
+    fd = source
+    while result is not None and 'INHERIT' in result:
         relpath = result.pop('INHERIT')
-        abspath = os.path.normpath(os.path.join(os.path.dirname(source.name), relpath))
+        abspath = os.path.normpath(os.path.join(os.path.dirname(fd.name), relpath))
         if not os.path.exists(abspath):
             raise exceptions.ConfigurationError(
                 f"Inherited config file '{relpath}' does not exist at '{abspath}'."
             )
+        if abspath in seen:
+            raise exceptions.ConfigurationError(
+                f"Circular INHERIT chain: config file '{abspath}' is inherited more than once."
+            )
+        seen.add(abspath)
         log.debug(f"Loading inherited configuration file: {abspath}")
+        chain.append(result)
         with open(abspath, 'rb') as fd:
-            parent = yaml_load(fd, Loader)
-        result = merge(parent, result)
+            result = yaml.load(fd, Loader=Loader)
+    if chain:
+        result = merge(result, *reversed(chain))
     return result
 
 
@@ -129,6 +147,7 @@ def get_build_date() -> str:
 
 def reduce_list(data_set: Iterable[str]) -> List[str]:
     """Reduce duplicate items in a list and preserve order"""
+    # dict.fromkeys dedupes in C; a set-guarded list comprehension is slower and peaks higher.
     return list(dict.fromkeys(data_set))
 
 
@@ -138,8 +157,19 @@ def copy_file(source_path: str, output_path: str) -> None:
 
     The output_path may be a directory.
     """
-    output_dir = os.path.dirname(output_path)
-    os.makedirs(output_dir, exist_ok=True)
+    # Most files go to a directory that already exists, so only create it when the copy fails.
+    try:
+        _copy_file_to(source_path, output_path)
+    except FileNotFoundError:
+        output_dir = os.path.dirname(output_path)
+        if not os.path.exists(source_path) or not output_dir or os.path.isdir(output_dir):
+            # Don't create directories for a copy that can't succeed anyway.
+            raise
+        os.makedirs(output_dir, exist_ok=True)
+        _copy_file_to(source_path, output_path)
+
+
+def _copy_file_to(source_path: str, output_path: str) -> None:
     if os.path.isdir(output_path):
         output_path = os.path.join(output_path, os.path.basename(source_path))
     shutil.copyfile(source_path, output_path)
@@ -149,9 +179,13 @@ def write_file(content: bytes, output_path: str) -> None:
     """
     Write content to output_path, making sure any parent directories exist.
     """
-    output_dir = os.path.dirname(output_path)
-    os.makedirs(output_dir, exist_ok=True)
-    with open(output_path, 'wb') as f:
+    # Most files go to a directory that already exists, so only create it when the open fails.
+    try:
+        f = open(output_path, 'wb')
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        f = open(output_path, 'wb')
+    with f:
         f.write(content)
 
 
@@ -162,17 +196,17 @@ def clean_directory(directory: str) -> None:
     if not os.path.exists(directory):
         return
 
-    for entry in os.listdir(directory):
-        # Don't remove hidden files from the directory. We never copy files
-        # that are hidden, so we shouldn't delete them either.
-        if entry.startswith('.'):
-            continue
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            # Don't remove hidden files from the directory. We never copy files
+            # that are hidden, so we shouldn't delete them either.
+            if entry.name.startswith('.'):
+                continue
 
-        path = os.path.join(directory, entry)
-        if os.path.isdir(path):
-            shutil.rmtree(path, True)
-        else:
-            os.unlink(path)
+            if entry.is_dir():
+                shutil.rmtree(entry.path, True)
+            else:
+                os.unlink(entry.path)
 
 
 def get_html_path(path):
@@ -202,7 +236,8 @@ def is_markdown_file(path: str) -> bool:
 
     https://superuser.com/questions/249436/file-extension-for-markdown-files
     """
-    return path.endswith(markdown_extensions)
+    dot = path.rfind('.')
+    return dot != -1 and path[dot:] in _MD_EXT_SET
 
 
 def is_html_file(path):
@@ -219,22 +254,21 @@ def is_template_file(path):
     return path.lower().endswith(('.html', '.htm', '.xml'))
 
 
-_ERROR_TEMPLATE_RE = re.compile(r'^\d{3}\.html?$')
-
-
 def is_error_template(path: str) -> bool:
     """
     Return True if the given file path is an HTTP error template.
     """
-    return bool(_ERROR_TEMPLATE_RE.match(path))
+    # Equivalent to matching `^\d{3}\.html?$`, without going through the regex engine.
+    return path[:3].isdecimal() and path[3:] in ('.html', '.htm')
 
 
 @functools.lru_cache(maxsize=None)
-def _norm_parts(path: str) -> List[str]:
+def _norm_parts(path: str) -> Tuple[str, ...]:
     if not path.startswith('/'):
         path = '/' + path
     path = posixpath.normpath(path)[1:]
-    return path.split('/') if path else []
+    # A tuple, as the cached result is shared by every caller.
+    return tuple(path.split('/')) if path else ()
 
 
 def get_relative_url(url: str, other: str) -> str:
@@ -247,20 +281,32 @@ def get_relative_url(url: str, other: str) -> str:
     Paths are normalized ('..' works as parent directory), but going higher than the
     root has no effect ('foo/../../bar' ends up just as 'bar').
     """
-    # Remove filename from other url if it has one.
-    dirname, _, basename = other.rpartition('/')
+    return _get_relative_url(url, get_url_dir_parts(other))
+
+
+def get_url_dir_parts(url: str) -> Tuple[str, ...]:
+    """
+    Return the normalized parts of the directory of the given url.
+
+    This is how `get_relative_url` sees its `other` argument, so the result can be kept and
+    reused for many URLs relative to the same page.
+    """
+    # Remove filename from url if it has one.
+    dirname, _, basename = url.rpartition('/')
     if '.' in basename:
-        other = dirname
+        url = dirname
+    return _norm_parts(url)
+
 
-    other_parts = _norm_parts(other)
+def _get_relative_url(url: str, other_parts: Tuple[str, ...]) -> str:
     dest_parts = _norm_parts(url)
-    common = 0
-    for a, b in zip(other_parts, dest_parts):
+    for common, (a, b) in enumerate(zip(other_parts, dest_parts)):
         if a != b:
             break
-        common += 1
+    else:
+        common = min(len(other_parts), len(dest_parts))
 
-    rel_parts = ['..'] * (len(other_parts) - common) + dest_parts[common:]
+    rel_parts = ('..',) * (len(other_parts) - common) + dest_parts[common:]
     relurl = '/'.join(rel_parts) or '.'
     return relurl + '/' if url.endswith('/') else relurl
 
@@ -271,15 +317,22 @@ def normalize_url(path: str, page: Optional[Page] = None, base: str = '') -> str
     if is_abs:
         return path
     if page is not None:
-        return get_relative_url(path, page.url)
+        # Page-like objects that only provide `url` are supported too.
+        parts = getattr(page, '_url_dir_parts', None)
+        if parts is None:
+            return get_relative_url(path, page.url)
+        return _get_relative_url(path, parts)
     return posixpath.join(base, path)
 
 
+_SEP_IS_NOT_SLASH = os.sep != '/'
+
+
 @functools.lru_cache(maxsize=None)
 def _get_norm_url(path: str) -> Tuple[str, bool]:
     if not path:
         path = '.'
-    elif os.sep != '/' and os.sep in path:
+    elif _SEP_IS_NOT_SLASH and os.sep in path:
         log.warning(
             f"Path '{path}' uses OS-specific separator '{os.sep}', "
             f"change it to '/' so it is recognized on other systems."
@@ -313,6 +366,7 @@ def get_theme_dir(name: str) -> str:
     return os.path.dirname(os.path.abspath(theme.load().__file__))
 
 
+@functools.lru_cache(maxsize=None)
 def get_themes() -> Dict[str, EntryPoint]:
     """Return a dict of all installed themes as {name: EntryPoint}."""
 
@@ -347,6 +401,7 @@ def get_theme_names():
     return get_themes().keys()
 
 
+@functools.lru_cache(maxsize=None)
 def dirname_to_title(dirname: str) -> str:
     """Return a page tile obtained from a directory name."""
     title = dirname
@@ -366,15 +421,12 @@ def get_markdown_title(markdown_src: str) -> Optional[str]:
     non-whitespace content. If it is a title, return that, otherwise return
     None.
     """
-    lines = markdown_src.replace('\r\n', '\n').replace('\r', '\n').split('\n')
-    while lines:
-        line = lines.pop(0).strip()
-        if not line.strip():
-            continue
-        if not line.startswith('# '):
-            return None
-        return line.lstrip('# ')
-    return None
+    # Blank lines are whitespace too, so the first line with content starts after the leading
+    # whitespace. Only that line needs to be split off, not the whole document.
+    line = markdown_src.lstrip().partition('\n')[0].partition('\r')[0].strip()
+    if not line.startswith('# '):
+        return None
+    return line.lstrip('# ')
 
 
 def find_or_create_node(branch, key):
@@ -402,20 +454,33 @@ def nest_paths(paths):
     the pages config.
     """
     nested = []
+    # Mirrors the nested sections as a trie of `title: (branch, subsections)`, so that a
+    # section is found with a dict lookup instead of a scan over its parent branch.
+    sections: Dict[str, Tuple[list, dict]] = {}
 
     for path in paths:
         parts = PurePath(path).parent.parts
 
-        branch = nested
+        branch, subsections = nested, sections
         for part in parts:
             part = dirname_to_title(part)
-            branch = find_or_create_node(branch, part)
+            if part not in subsections:
+                new_branch: list = []
+                branch.append({part: new_branch})
+                subsections[part] = (new_branch, {})
+            branch, subsections = subsections[part]
 
         branch.append(path)
 
     return nested
 
 
+_LEVEL_NAMES = {
+    level: logging.getLevelName(level)
+    for level in (logging.DEBUG, logging.INFO, logging.WARNING, logging.ERROR, logging.CRITICAL)
+}
+
+
 class CountHandler(logging.NullHandler):
     """Counts all logged messages >= level."""
 
@@ -431,7 +496,10 @@ class CountHandler(logging.NullHandler):
         return rv
 
     def get_counts(self) -> List[Tuple[str, int]]:
-        return [(logging.getLevelName(k), v) for k, v in sorted(self.counts.items(), reverse=True)]
+        return [
+            (_LEVEL_NAMES.get(k) or logging.getLevelName(k), v)
+            for k, v in sorted(self.counts.items(), reverse=True)
+        ]
 
 
 # For backward compatibility as some plugins import it.